@@ -3,142 +3,211 @@ Password Strength Checker - Command Line Interface
 Interactive CLI for password analysis
 """
 
+import os
 import sys
+import codecs
 from password_strength_checker import PasswordStrengthChecker
 import getpass
 
+try:
+    import termios
+except ImportError:  # Windows: getpass already reads key-by-key via msvcrt
+    termios = None
 
-def print_banner():
-    """Print application banner."""
+
+def _supports_unicode() -> bool:
+    """Check whether stdout can encode the symbols used in reports."""
     try:
-        banner = """
+        '✓'.encode(sys.stdout.encoding or 'ascii')
+    except (UnicodeEncodeError, LookupError):
+        return False
+    return True
+
+
+# Probe the terminal's own encoding, then escape (rather than crash on)
+# any other character it cannot show
+_UNICODE_OK = _supports_unicode()
+if hasattr(sys.stdout, 'reconfigure'):
+    sys.stdout.reconfigure(errors='backslashreplace')
+
+CHECK, CROSS = ('✓', '✗') if _UNICODE_OK else ('[OK]', '[X]')
+
+BANNER_UNICODE = """
     ╔═══════════════════════════════════════════════════════════╗
     ║     🔒 PASSWORD STRENGTH CHECKER - CLI VERSION            ║
     ║     Comprehensive Security Analysis Tool                  ║
     ╚═══════════════════════════════════════════════════════════╝
     """
-        print(banner)
-    except UnicodeEncodeError:
-        banner = """
+
+BANNER_ASCII = """
     ===================================================================
     PASSWORD STRENGTH CHECKER - CLI VERSION
     Comprehensive Security Analysis Tool
     ===================================================================
     """
-        print(banner)
+
+BANNER = BANNER_UNICODE if _UNICODE_OK else BANNER_ASCII
+
+SEP = ("─" if _UNICODE_OK else "-") * 70
+
+GOODBYE = "\n👋 Goodbye! Stay secure!" if _UNICODE_OK else "\nGoodbye! Stay secure!"
+INTERRUPTED = "\n\n👋 Interrupted. Goodbye!" if _UNICODE_OK else "\n\nInterrupted. Goodbye!"
+
+_EXIT_CMDS = frozenset({'quit', 'exit', 'q'})
+_YES = frozenset({'y', 'yes'})
+_EXPORT_FMTS = frozenset({'json', 'txt'})
+
+# (pattern key, CLI label) rows in the order the CLI report lists them
+CLI_PATTERN_ROWS = (
+    ('sequential_digits', 'Sequential Digits'),
+    ('sequential_letters', 'Sequential Letters'),
+    ('repetitive_chars', 'Repetitive Characters'),
+    ('keyboard_patterns', 'Keyboard Patterns'),
+    ('date_patterns', 'Date Patterns'),
+    ('common_patterns', 'Common Patterns'),
+)
+
+
+def print_banner():
+    """Print application banner."""
+    print(BANNER)
+
+
+def _read_password(prompt: str) -> str:
+    """
+    Read a password from the terminal without echo.
+    
+    getpass reads in canonical mode, where the tty line discipline caps a
+    line at ~1024 bytes and long pastes stall. On POSIX terminals this reads
+    in non-canonical mode instead, handling backspace/kill itself. Input is
+    read a byte at a time so anything typed or pasted after the newline is
+    left for the next prompt.
+    """
+    if termios is None or not sys.stdin.isatty():
+        return getpass.getpass(prompt)
+    
+    fd = sys.stdin.fileno()
+    old_attrs = termios.tcgetattr(fd)
+    new_attrs = termios.tcgetattr(fd)
+    new_attrs[3] &= ~(termios.ECHO | termios.ICANON)
+    new_attrs[6][termios.VMIN] = 1
+    new_attrs[6][termios.VTIME] = 0
+    decoder = codecs.getincrementaldecoder(sys.stdin.encoding or 'utf-8')('replace')
+    chars = []
+    
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    try:
+        termios.tcsetattr(fd, termios.TCSANOW, new_attrs)
+        while True:
+            data = os.read(fd, 1)
+            if not data:
+                raise EOFError
+            for ch in decoder.decode(data):
+                if ch in '\r\n':
+                    return ''.join(chars)
+                if ch in '\x7f\b':
+                    if chars:
+                        chars.pop()
+                elif ch == '\x15':  # Ctrl-U
+                    chars.clear()
+                elif ch == '\x04':  # Ctrl-D
+                    if not chars:
+                        raise EOFError
+                else:
+                    chars.append(ch)
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, old_attrs)
+        sys.stdout.write('\n')
+        sys.stdout.flush()
 
 
 def print_report(report):
     """Print formatted analysis report."""
-    print("\n" + "=" * 70)
-    print("PASSWORD STRENGTH ANALYSIS REPORT")
-    print("=" * 70)
+    ct = report['cracking_time']
+    ca = report['character_analysis']
+    patterns = report['patterns_detected']
+    dc = report['dictionary_check']
+    
+    out = []
+    append = out.append
+    append("\n" + "=" * 70)
+    append("PASSWORD STRENGTH ANALYSIS REPORT")
+    append("=" * 70)
     
     # Basic Info
-    print(f"\n📊 BASIC INFORMATION")
-    print("-" * 70)
-    print(f"Password Length:     {report['length']} characters")
-    print(f"Entropy:             {report['entropy_bits']} bits")
-    print(f"Strength Score:       {report['score']:.2f}/100")
-    print(f"Category:            {report['category']}")
+    append(f"\n📊 BASIC INFORMATION")
+    append("-" * 70)
+    append(f"Password Length:     {report['length']} characters")
+    append(f"Entropy:             {report['entropy_bits']} bits")
+    append(f"Strength Score:       {report['score']:.2f}/100")
+    append(f"Category:            {report['category']}")
     
     # Cracking Time
-    print(f"\n⏱️  CRACKING TIME ESTIMATES")
-    print("-" * 70)
-    ct = report['cracking_time']
-    print(f"Online Brute-Force:  {ct.get('online_brute_force', 'N/A')}")
-    print(f"Offline CPU Attack:  {ct.get('offline_cpu', 'N/A')}")
-    print(f"Offline GPU Attack:  {ct.get('offline_gpu', 'N/A')}")
-    print(f"Cloud Cracking:      {ct.get('cloud_cracking', 'N/A')}")
-    print(f"Possible Combinations: {ct.get('combinations', 'N/A')}")
+    append(f"\n⏱️  CRACKING TIME ESTIMATES")
+    append("-" * 70)
+    append(f"Online Brute-Force:  {ct.get('online_brute_force', 'N/A')}")
+    append(f"Offline CPU Attack:  {ct.get('offline_cpu', 'N/A')}")
+    append(f"Offline GPU Attack:  {ct.get('offline_gpu', 'N/A')}")
+    append(f"Cloud Cracking:      {ct.get('cloud_cracking', 'N/A')}")
+    append(f"Possible Combinations: {ct.get('combinations', 'N/A')}")
     
     # Character Analysis
-    print(f"\n🔤 CHARACTER ANALYSIS")
-    print("-" * 70)
-    ca = report['character_analysis']
-    try:
-        check = '✓'
-        cross = '✗'
-    except:
-        check = '[OK]'
-        cross = '[X]'
-    print(f"Lowercase letters:   {ca.get('lowercase_count', 0)} ({check if ca.get('has_lowercase') else cross})")
-    print(f"Uppercase letters:   {ca.get('uppercase_count', 0)} ({check if ca.get('has_uppercase') else cross})")
-    print(f"Digits:              {ca.get('digit_count', 0)} ({check if ca.get('has_digits') else cross})")
-    print(f"Special symbols:     {ca.get('symbol_count', 0)} ({check if ca.get('has_symbols') else cross})")
-    print(f"Unicode characters:  {check if ca.get('has_unicode') else cross}")
-    print(f"Character Set Size:  {ca.get('character_set_size', 0)}")
-    print(f"Diversity Score:     {ca.get('diversity_score', 0)}/100")
+    append(f"\n🔤 CHARACTER ANALYSIS")
+    append("-" * 70)
+    append(f"Lowercase letters:   {ca.get('lowercase_count', 0)} ({CHECK if ca.get('has_lowercase') else CROSS})")
+    append(f"Uppercase letters:   {ca.get('uppercase_count', 0)} ({CHECK if ca.get('has_uppercase') else CROSS})")
+    append(f"Digits:              {ca.get('digit_count', 0)} ({CHECK if ca.get('has_digits') else CROSS})")
+    append(f"Special symbols:     {ca.get('symbol_count', 0)} ({CHECK if ca.get('has_symbols') else CROSS})")
+    append(f"Unicode characters:  {CHECK if ca.get('has_unicode') else CROSS}")
+    append(f"Character Set Size:  {ca.get('character_set_size', 0)}")
+    append(f"Diversity Score:     {ca.get('diversity_score', 0)}/100")
     
     # Patterns
-    print(f"\n🔍 PATTERNS DETECTED")
-    print("-" * 70)
-    patterns = report['patterns_detected']
+    append(f"\n🔍 PATTERNS DETECTED")
+    append("-" * 70)
     pattern_found = False
-    
-    if patterns.get('sequential_digits'):
-        pattern_found = True
-        print(f"⚠️  Sequential Digits: {', '.join(patterns['sequential_digits'])}")
-    
-    if patterns.get('sequential_letters'):
-        pattern_found = True
-        print(f"⚠️  Sequential Letters: {', '.join(patterns['sequential_letters'])}")
-    
-    if patterns.get('repetitive_chars'):
-        pattern_found = True
-        print(f"⚠️  Repetitive Characters: {', '.join(patterns['repetitive_chars'])}")
-    
-    if patterns.get('keyboard_patterns'):
-        pattern_found = True
-        print(f"⚠️  Keyboard Patterns: {', '.join(patterns['keyboard_patterns'])}")
-    
-    if patterns.get('date_patterns'):
-        pattern_found = True
-        print(f"⚠️  Date Patterns: {', '.join(patterns['date_patterns'])}")
-    
-    if patterns.get('common_patterns'):
-        pattern_found = True
-        print(f"⚠️  Common Patterns: {', '.join(patterns['common_patterns'])}")
+    for key, label in CLI_PATTERN_ROWS:
+        found = patterns.get(key)
+        if found:
+            pattern_found = True
+            append(f"⚠️  {label}: {', '.join(found)}")
     
     if not pattern_found:
-        try:
-            print("✓ No weak patterns detected")
-        except:
-            print("[OK] No weak patterns detected")
+        append(f"{CHECK} No weak patterns detected")
     
     # Dictionary Check
-    print(f"\n📚 DICTIONARY CHECK")
-    print("-" * 70)
-    dc = report['dictionary_check']
-    if dc.get('is_common_password'):
-        print("⚠️  WARNING: This is a common password!")
-    if dc.get('contains_dictionary_word'):
-        words = dc.get('dictionary_words_found', [])
-        print(f"⚠️  Dictionary words found: {', '.join(words)}")
+    append(f"\n📚 DICTIONARY CHECK")
+    append("-" * 70)
+    is_common = dc.get('is_common_password')
+    has_word = dc.get('contains_dictionary_word')
+    has_substitution = dc.get('contains_substituted_word')
+    if is_common:
+        append("⚠️  WARNING: This is a common password!")
+    if has_word:
+        append(f"⚠️  Dictionary words found: {', '.join(dc.get('dictionary_words_found', []))}")
     if dc.get('contains_reversed_word'):
-        print("⚠️  Reversed dictionary word detected")
-    if dc.get('contains_substituted_word'):
-        print("⚠️  Character substitution detected (e.g., @ for a)")
-    if not any([dc.get('is_common_password'), dc.get('contains_dictionary_word'),
-               dc.get('contains_substituted_word')]):
-        try:
-            print("✓ No dictionary words detected")
-        except:
-            print("[OK] No dictionary words detected")
+        append("⚠️  Reversed dictionary word detected")
+    if has_substitution:
+        append("⚠️  Character substitution detected (e.g., @ for a)")
+    if not (is_common or has_word or has_substitution):
+        append(f"{CHECK} No dictionary words detected")
     
     # Recommendations
-    print(f"\n💡 RECOMMENDATIONS")
-    print("-" * 70)
+    append(f"\n💡 RECOMMENDATIONS")
+    append("-" * 70)
     recommendations = report.get('recommendations', [])
     if recommendations:
         for i, rec in enumerate(recommendations, 1):
-            print(f"{i}. {rec}")
+            append(f"{i}. {rec}")
     else:
-        print("No specific recommendations. Password appears strong!")
+        append("No specific recommendations. Password appears strong!")
+    
+    append("\n" + "=" * 70)
+    append(f"Analysis completed at: {report['timestamp']}")
+    append("=" * 70 + "\n")
     
-    print("\n" + "=" * 70)
-    print(f"Analysis completed at: {report['timestamp']}")
-    print("=" * 70 + "\n")
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def main():
@@ -153,14 +222,11 @@ def main():
     while True:
         try:
             # Get password input
-            print("─" * 70)
-            password = getpass.getpass("Enter password (hidden): ")
+            print(SEP)
+            password = _read_password("Enter password (hidden): ")
             
-            if password.lower() in ['quit', 'exit', 'q']:
-                try:
-                    print("\n👋 Goodbye! Stay secure!")
-                except:
-                    print("\nGoodbye! Stay secure!")
+            if len(password) <= 4 and password.lower() in _EXIT_CMDS:
+                print(GOODBYE)
                 break
             
             if not password:
@@ -176,33 +242,27 @@ def main():
             
             # Ask for export
             export = input("Export report? (json/txt/n): ").lower()
-            if export in ['json', 'txt']:
+            if export in _EXPORT_FMTS:
                 filename = input(f"Enter filename (without extension): ")
                 if filename:
                     try:
                         checker.export_report(report, f"{filename}.{export}", export)
-                        print(f"✓ Report exported to {filename}.{export}\n")
+                        print(f"{CHECK} Report exported to {filename}.{export}\n")
                     except Exception as e:
-                        print(f"✗ Error exporting: {e}\n")
+                        print(f"{CROSS} Error exporting: {e}\n")
             
             # Continue?
             continue_choice = input("Analyze another password? (y/n): ").lower()
-            if continue_choice not in ['y', 'yes']:
-                try:
-                    print("\n👋 Goodbye! Stay secure!")
-                except:
-                    print("\nGoodbye! Stay secure!")
+            if continue_choice not in _YES:
+                print(GOODBYE)
                 break
             print()
             
         except KeyboardInterrupt:
-            try:
-                print("\n\n👋 Interrupted. Goodbye!")
-            except:
-                print("\n\nInterrupted. Goodbye!")
+            print(INTERRUPTED)
             sys.exit(0)
         except Exception as e:
-            print(f"\n✗ Error: {e}\n")
+            print(f"\n{CROSS} Error: {e}\n")
             continue
 
 
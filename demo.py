@@ -3,30 +3,91 @@ Password Strength Checker - Demo Script
 Demonstrates various password analysis scenarios
 """
 
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from password_strength_checker import PasswordStrengthChecker
 
 
-def print_separator():
-    """Print visual separator."""
-    print("\n" + "=" * 80 + "\n")
+def _supports_unicode() -> bool:
+    """Check whether stdout can encode the symbols used in the demo."""
+    try:
+        '✓'.encode(sys.stdout.encoding or 'ascii')
+    except (UnicodeEncodeError, LookupError):
+        return False
+    return True
 
 
-def demo():
-    """Run demonstration of password strength checker."""
-    try:
-        print("""
+# Probe the terminal's own encoding, then escape (rather than crash on)
+# any other character it cannot show
+_UNICODE_OK = _supports_unicode()
+if hasattr(sys.stdout, 'reconfigure'):
+    sys.stdout.reconfigure(errors='backslashreplace')
+
+CHECK, CROSS = ('✓', '✗') if _UNICODE_OK else ('[OK]', '[X]')
+
+BANNER_UNICODE = """
     ╔══════════════════════════════════════════════════════════════════════╗
     ║     🔒 PASSWORD STRENGTH CHECKER - DEMONSTRATION                    ║
     ║     Testing Various Password Scenarios                              ║
     ╚══════════════════════════════════════════════════════════════════════╝
-    """)
-    except UnicodeEncodeError:
-        print("""
+    """
+
+BANNER_ASCII = """
     ========================================================================
     PASSWORD STRENGTH CHECKER - DEMONSTRATION
     Testing Various Password Scenarios
     ========================================================================
-    """)
+    """
+
+BANNER = BANNER_UNICODE if _UNICODE_OK else BANNER_ASCII
+
+SEP = "\n" + "=" * 80 + "\n"
+
+COMPLETION = (
+    "✅ Demonstration complete!\n\n💡 Key Takeaways:" if _UNICODE_OK
+    else "[SUCCESS] Demonstration complete!\n\nKey Takeaways:"
+)
+
+# Below this many passwords, worker start-up costs more than the analysis
+PARALLEL_THRESHOLD = 64
+
+_worker_checker = None
+
+
+def _init_worker(dictionary_file):
+    """Create one checker per worker process, configured like the caller's."""
+    global _worker_checker
+    _worker_checker = PasswordStrengthChecker(dictionary_file)
+
+
+def _analyze_in_worker(password):
+    """Analyze a password with the worker's checker."""
+    return _worker_checker.analyze(password)
+
+
+def analyze_passwords(checker, passwords):
+    """
+    Analyze a list of passwords with the given checker, preserving order.
+    
+    Large batches are spread over a process pool whose workers load the
+    same dictionary file; small ones are analyzed in-process.
+    """
+    if len(passwords) < PARALLEL_THRESHOLD:
+        return [checker.analyze(pw) for pw in passwords]
+    
+    with ProcessPoolExecutor(initializer=_init_worker,
+                             initargs=(checker.dictionary_file,)) as executor:
+        return list(executor.map(_analyze_in_worker, passwords, chunksize=16))
+
+
+def print_separator():
+    """Print visual separator."""
+    print(SEP)
+
+
+def demo():
+    """Run demonstration of password strength checker."""
+    print(BANNER)
     
     # Initialize checker
     checker = PasswordStrengthChecker()
@@ -77,76 +138,67 @@ def demo():
     
     print(f"Testing {len(test_cases)} different password scenarios...\n")
     
-    results = []
+    results = analyze_passwords(checker, [tc['password'] for tc in test_cases])
     
-    for i, test_case in enumerate(test_cases, 1):
-        print_separator()
-        print(f"TEST CASE {i}/{len(test_cases)}: {test_case['name']}")
-        print(f"Password: {test_case['password']}")
-        print(f"Description: {test_case['description']}")
-        print("-" * 80)
-        
-        # Analyze
-        report = checker.analyze(test_case['password'])
-        results.append(report)
+    for i, (test_case, report) in enumerate(zip(test_cases, results), 1):
+        out = [SEP, f"TEST CASE {i}/{len(test_cases)}: {test_case['name']}"]
+        out.append(f"Password: {test_case['password']}")
+        out.append(f"Description: {test_case['description']}")
+        out.append("-" * 80)
         
         # Display key metrics
-        print(f"\n📊 RESULTS:")
-        print(f"  Length:        {report['length']} characters")
-        print(f"  Entropy:       {report['entropy_bits']} bits")
-        print(f"  Score:         {report['score']:.2f}/100")
-        print(f"  Category:      {report['category']}")
-        print(f"  Cracking Time: {report['cracking_time']['offline_gpu']}")
+        out.append(f"\n📊 RESULTS:")
+        out.append(f"  Length:        {report['length']} characters")
+        out.append(f"  Entropy:       {report['entropy_bits']} bits")
+        out.append(f"  Score:         {report['score']:.2f}/100")
+        out.append(f"  Category:      {report['category']}")
+        out.append(f"  Cracking Time: {report['cracking_time']['offline_gpu']}")
         
         # Character analysis
         ca = report['character_analysis']
-        print(f"\n🔤 CHARACTER COMPOSITION:")
-        try:
-            check_mark = '✓'
-            cross_mark = '✗'
-        except:
-            check_mark = '[OK]'
-            cross_mark = '[X]'
-        print(f"  Lowercase: {check_mark if ca['has_lowercase'] else cross_mark} ({ca['lowercase_count']})")
-        print(f"  Uppercase: {check_mark if ca['has_uppercase'] else cross_mark} ({ca['uppercase_count']})")
-        print(f"  Digits:    {check_mark if ca['has_digits'] else cross_mark} ({ca['digit_count']})")
-        print(f"  Symbols:   {check_mark if ca['has_symbols'] else cross_mark} ({ca['symbol_count']})")
+        out.append(f"\n🔤 CHARACTER COMPOSITION:")
+        out.append(f"  Lowercase: {CHECK if ca['has_lowercase'] else CROSS} ({ca['lowercase_count']})")
+        out.append(f"  Uppercase: {CHECK if ca['has_uppercase'] else CROSS} ({ca['uppercase_count']})")
+        out.append(f"  Digits:    {CHECK if ca['has_digits'] else CROSS} ({ca['digit_count']})")
+        out.append(f"  Symbols:   {CHECK if ca['has_symbols'] else CROSS} ({ca['symbol_count']})")
         
         # Patterns
         patterns = report['patterns_detected']
         has_patterns = any(patterns.values())
         if has_patterns:
-            print(f"\n⚠️  WEAK PATTERNS DETECTED:")
+            out.append(f"\n⚠️  WEAK PATTERNS DETECTED:")
             for pattern_type, pattern_list in patterns.items():
                 if pattern_list:
-                    print(f"  • {pattern_type.replace('_', ' ').title()}: {', '.join(pattern_list[:3])}")
+                    out.append(f"  • {pattern_type.replace('_', ' ').title()}: {', '.join(pattern_list[:3])}")
         else:
-            try:
-                print(f"\n✓ No weak patterns detected")
-            except:
-                print(f"\n[OK] No weak patterns detected")
+            out.append(f"\n{CHECK} No weak patterns detected")
         
         # Dictionary check
         dc = report['dictionary_check']
         if dc['is_common_password'] or dc['contains_dictionary_word']:
-            print(f"\n⚠️  DICTIONARY CHECK:")
+            out.append(f"\n⚠️  DICTIONARY CHECK:")
             if dc['is_common_password']:
-                print(f"  • Common password detected")
+                out.append(f"  • Common password detected")
             if dc['contains_dictionary_word']:
-                print(f"  • Dictionary words: {', '.join(dc['dictionary_words_found'][:3])}")
+                out.append(f"  • Dictionary words: {', '.join(dc['dictionary_words_found'][:3])}")
         
         # Top recommendation
         if report['recommendations']:
-            print(f"\n💡 TOP RECOMMENDATION:")
-            print(f"  • {report['recommendations'][0]}")
+            out.append(f"\n💡 TOP RECOMMENDATION:")
+            out.append(f"  • {report['recommendations'][0]}")
+        
+        sys.stdout.write("\n".join(out) + "\n")
     
     # Summary
     print_separator()
     print("📈 SUMMARY STATISTICS")
     print("-" * 80)
     
+    total_score = total_entropy = 0.0
     categories = {}
     for report in results:
+        total_score += report['score']
+        total_entropy += report['entropy_bits']
         cat = report['category']
         categories[cat] = categories.get(cat, 0) + 1
     
@@ -154,24 +206,19 @@ def demo():
     for cat, count in sorted(categories.items()):
         print(f"  {cat:15} : {count} password(s)")
     
-    avg_score = sum(r['score'] for r in results) / len(results)
-    avg_entropy = sum(r['entropy_bits'] for r in results) / len(results)
+    avg_score = total_score / len(results)
+    avg_entropy = total_entropy / len(results)
     
     print(f"\nAverage Score:   {avg_score:.2f}/100")
     print(f"Average Entropy: {avg_entropy:.2f} bits")
     
     print_separator()
-    try:
-        print("✅ Demonstration complete!")
-        print("\n💡 Key Takeaways:")
-    except:
-        print("[SUCCESS] Demonstration complete!")
-        print("\nKey Takeaways:")
+    print(COMPLETION)
     print("  • Longer passwords with diverse character sets = stronger")
     print("  • Avoid dictionary words and common patterns")
     print("  • Random combinations are more secure than predictable patterns")
     print("  • Aim for entropy > 60 bits for strong passwords")
-    print("\n" + "=" * 80 + "\n")
+    print_separator()
 
 
 if __name__ == "__main__":
@@ -4,15 +4,154 @@ Modern, user-friendly interface built with tkinter
 """
 
 import tkinter as tk
-from tkinter import ttk, scrolledtext, messagebox, filedialog
-from password_strength_checker import PasswordStrengthChecker
-import json
-from datetime import datetime
+from tkinter import ttk, scrolledtext, messagebox
+from tkinter import font as tkfont
+from password_strength_checker import PasswordStrengthChecker, password_digest
+from bisect import bisect_right
+
+
+# Score thresholds separating the progress bar color bands
+SCORE_BANDS = (30, 50, 70, 90)
+
+# Progress bar color per band, weakest first
+PROGRESS_COLORS = (
+    ('red', '#e74c3c'),
+    ('orange', '#f39c12'),
+    ('yellow', '#f1c40f'),
+    ('lightgreen', '#2ecc71'),
+    ('green', '#27ae60'),
+)
+
+PROGRESS_STYLES = tuple(f'{name}.Horizontal.TProgressbar' for name, _ in PROGRESS_COLORS)
+
+# Display labels for the pattern types reported by PasswordStrengthChecker
+_KNOWN_PATTERN_TYPES = (
+    'sequential_digits', 'sequential_letters', 'repetitive_chars',
+    'keyboard_patterns', 'common_patterns', 'date_patterns',
+)
+PATTERN_LABELS = {k: k.replace('_', ' ').title() for k in _KNOWN_PATTERN_TYPES}
+
+# Report sections, in display order: (tab title, text tag, formatter method, font)
+REPORT_SECTIONS = (
+    ("Overview", 'overview', 'format_overview', ('Consolas', 10)),
+    ("Detailed Analysis", 'details', 'format_details', ('Consolas', 9)),
+    ("Recommendations", 'rec', 'format_recommendations', ('Arial', 10)),
+)
+
+SECTION_GAP = "\n\n"
+
+RULE_50 = "=" * 50
+DASH_50 = "-" * 50
+RULE_60 = "=" * 60
+DASH_60 = "-" * 60
+
+# Report tab templates, filled with str.format_map
+OVERVIEW_TEMPLATE = """\
+PASSWORD STRENGTH OVERVIEW
+{rule}
+
+Password Length: {length} characters
+Entropy: {entropy_bits} bits
+Strength Score: {score:.2f}/100
+Category: {category}
+
+CRACKING TIME ESTIMATES:
+{dash}
+Online Brute-Force:  {online}
+Offline CPU Attack:  {cpu}
+Offline GPU Attack:  {gpu}
+Cloud Cracking:      {cloud}
+
+CHARACTER COMPOSITION:
+{dash}
+✓ Lowercase letters: {lowercase}
+✓ Uppercase letters: {uppercase}
+✓ Digits:            {digits}
+✓ Special symbols:   {symbols}
+Character set size:  {charset}"""
+
+DETAILS_TEMPLATE = """\
+DETAILED PASSWORD ANALYSIS
+{rule}
+
+PATTERNS DETECTED:
+{dash}
+{patterns}
+
+DICTIONARY CHECK:
+{dash}
+{dictionary}
+
+ENTROPY ANALYSIS:
+{dash}
+Entropy: {entropy_bits} bits
+Possible combinations: {combinations}"""
+
+TRUNCATION_NOTE = (
+    "\n\nNote: only the first {length} of {truncated_from} characters "
+    "were analyzed; actual strength is at least the reported value."
+)
+
+RECOMMENDATIONS_HEADER = "SECURITY RECOMMENDATIONS\n" + RULE_60 + "\n\n"
+
+SECURITY_TIPS = (
+    "\n\nGENERAL PASSWORD SECURITY TIPS:\n"
+    + DASH_60 + "\n"
+    + "\n".join([
+        "• Use unique passwords for each account",
+        "• Never share your passwords with anyone",
+        "• Consider using a password manager",
+        "• Enable two-factor authentication when available",
+        "• Change passwords if you suspect a breach",
+        "• Avoid using personal information (names, dates, etc.)",
+        "• Use passphrases for better memorability and security",
+    ])
+)
+
+# Options shared by every button; per-button options override these
+BUTTON_DEFAULTS = {'cursor': 'hand2'}
+
+
+def _mkbutton(parent, text: str, command, **extra) -> ttk.Button:
+    """Create a button with the shared defaults merged in."""
+    return ttk.Button(parent, text=text, command=command, **{**BUTTON_DEFAULTS, **extra})
+
+
+# Tk before 8.7 counts text indices in UTF-16 code units, so every character
+# above U+FFFF (emoji) takes up two index positions
+_TK_UTF16_INDICES = tk.TkVersion < 8.7
+
+
+def _tk_len(text: str) -> int:
+    """Return the length of text as counted by Tk text indices."""
+    if _TK_UTF16_INDICES and not text.isascii():
+        return len(text.encode('utf-16-le')) // 2
+    return len(text)
+
+
+def _common_prefix_len(a: str, b: str) -> int:
+    """Return the length of the common prefix of two strings."""
+    n = min(len(a), len(b))
+    i = 0
+    while i < n and a[i] == b[i]:
+        i += 1
+    return i
 
 
 class PasswordStrengthGUI:
     """GUI application for password strength checking."""
     
+    # Delay after the last keystroke before live analysis runs
+    ANALYZE_DELAY_MS = 150
+    
+    # Longer passwords are truncated before analysis; the score is saturated
+    # well before this length and pattern scans grow with it
+    MAX_ANALYZE_LEN = 100
+    
+    # Number of recent analyses whose formatted sections are kept for
+    # instant re-display (the checker memoizes the analyses themselves)
+    CACHE_SIZE = 128
+    
     def __init__(self, root):
         self.root = root
         self.root.title("Password Strength Checker - Cybersecurity Tool")
@@ -22,126 +161,125 @@ class PasswordStrengthGUI:
         # Initialize checker
         self.checker = PasswordStrengthChecker()
         
+        # Analysis runs off the Tk main thread; results come back via after().
+        # The worker is created on first use to keep startup light.
+        self._executor = None
+        self._pending_after = None
+        self._in_flight = 0
+        
+        # Text currently shown in the report widget, and the last color
+        # band/category applied, so unchanged widgets are left alone
+        self._rendered = ""
+        self._last_band = None
+        self._last_category = None
+        
+        # Formatted report sections keyed by (password digest, section tag)
+        self._format_cache = {}
+        
         # Password variable
         self.password_var = tk.StringVar()
-        self.password_var.trace('w', self.on_password_change)
+        self._password_trace = None
+        
+        # Live analysis while typing; the write trace is only registered
+        # while this is enabled
+        self.live_analysis_var = tk.BooleanVar(value=True)
         
         self.setup_ui()
+        self.toggle_live_analysis()
     
     def setup_ui(self):
         """Setup the user interface."""
+        self._init_styles()
+        
         # Header
         header_frame = tk.Frame(self.root, bg='#2c3e50', height=80)
         header_frame.pack(fill=tk.X, padx=0, pady=0)
         header_frame.pack_propagate(False)
         
-        title_label = tk.Label(
+        title_label = ttk.Label(
             header_frame,
             text="🔒 Password Strength Checker",
-            font=('Arial', 20, 'bold'),
-            bg='#2c3e50',
-            fg='white'
+            style='Header.TLabel'
         )
         title_label.pack(pady=20)
         
-        subtitle_label = tk.Label(
+        subtitle_label = ttk.Label(
             header_frame,
             text="Comprehensive Security Analysis Tool",
-            font=('Arial', 10),
-            bg='#2c3e50',
-            fg='#ecf0f1'
+            style='Subheader.TLabel'
         )
         subtitle_label.pack()
         
         # Main container
-        main_frame = tk.Frame(self.root, bg='#f0f0f0')
+        main_frame = ttk.Frame(self.root)
         main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
         
         # Password input section
-        input_frame = tk.LabelFrame(
+        input_frame = ttk.LabelFrame(
             main_frame,
             text="Enter Password",
-            font=('Arial', 12, 'bold'),
-            bg='#f0f0f0',
-            fg='#2c3e50',
-            padx=15,
-            pady=15
+            padding=15
         )
         input_frame.pack(fill=tk.X, pady=(0, 15))
         
         # Password entry with show/hide toggle
-        entry_frame = tk.Frame(input_frame, bg='#f0f0f0')
+        entry_frame = ttk.Frame(input_frame)
         entry_frame.pack(fill=tk.X)
         
-        self.password_entry = tk.Entry(
+        self.password_entry = ttk.Entry(
             entry_frame,
             textvariable=self.password_var,
-            font=('Arial', 14),
+            font='HeadingFont',
             show='*',
             width=40
         )
         self.password_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 10))
         
         self.show_password_var = tk.BooleanVar()
-        show_check = tk.Checkbutton(
+        show_check = ttk.Checkbutton(
             entry_frame,
             text="Show",
             variable=self.show_password_var,
-            command=self.toggle_password_visibility,
-            bg='#f0f0f0',
-            font=('Arial', 10)
+            command=self.toggle_password_visibility
         )
         show_check.pack(side=tk.RIGHT)
         
-        # Analyze button
-        analyze_btn = tk.Button(
-            input_frame,
-            text="🔍 Analyze Password",
-            command=self.analyze_password,
-            font=('Arial', 12, 'bold'),
-            bg='#3498db',
-            fg='white',
-            activebackground='#2980b9',
-            activeforeground='white',
-            relief=tk.RAISED,
-            bd=3,
-            padx=20,
-            pady=10,
-            cursor='hand2'
+        live_check = ttk.Checkbutton(
+            entry_frame,
+            text="Live",
+            variable=self.live_analysis_var,
+            command=self.toggle_live_analysis
         )
-        analyze_btn.pack(pady=(10, 0))
+        live_check.pack(side=tk.RIGHT, padx=(0, 10))
+        
+        # Analyze button
+        self.analyze_btn = _mkbutton(input_frame, "🔍 Analyze Password", self.analyze_password,
+                                style='Primary.TButton')
+        self.analyze_btn.pack(pady=(10, 0))
         
         # Results section
-        results_frame = tk.LabelFrame(
+        results_frame = ttk.LabelFrame(
             main_frame,
             text="Analysis Results",
-            font=('Arial', 12, 'bold'),
-            bg='#f0f0f0',
-            fg='#2c3e50',
-            padx=15,
-            pady=15
+            padding=15
         )
         results_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 15))
         
         # Score and category display
-        score_frame = tk.Frame(results_frame, bg='#f0f0f0')
+        score_frame = ttk.Frame(results_frame)
         score_frame.pack(fill=tk.X, pady=(0, 15))
         
-        self.score_label = tk.Label(
+        self.score_label = ttk.Label(
             score_frame,
             text="Score: --/100",
-            font=('Arial', 16, 'bold'),
-            bg='#f0f0f0',
-            fg='#7f8c8d'
+            style='Score.TLabel'
         )
         self.score_label.pack(side=tk.LEFT)
         
-        self.category_label = tk.Label(
+        self.category_label = ttk.Label(
             score_frame,
             text="Category: --",
-            font=('Arial', 16, 'bold'),
-            bg='#f0f0f0',
-            fg='#7f8c8d'
+            style='Score.TLabel'
         )
         self.category_label.pack(side=tk.RIGHT)
         
@@ -154,98 +292,113 @@ class PasswordStrengthGUI:
         )
         self.progress_bar.pack(fill=tk.X, pady=(0, 15))
         
-        # Detailed results in notebook (tabs)
-        notebook = ttk.Notebook(results_frame)
-        notebook.pack(fill=tk.BOTH, expand=True)
-        
-        # Overview tab
-        overview_frame = tk.Frame(notebook, bg='white')
-        notebook.add(overview_frame, text="Overview")
-        self.overview_text = scrolledtext.ScrolledText(
-            overview_frame,
-            wrap=tk.WORD,
-            font=('Consolas', 10),
-            bg='white',
-            fg='#2c3e50',
-            padx=10,
-            pady=10
-        )
-        self.overview_text.pack(fill=tk.BOTH, expand=True)
+        # Detailed results: one text widget holding every section as a tagged
+        # region; the notebook tabs only scroll to the matching section
+        self.notebook = ttk.Notebook(results_frame)
+        self.notebook.pack(fill=tk.X)
         
-        # Details tab
-        details_frame = tk.Frame(notebook, bg='white')
-        notebook.add(details_frame, text="Detailed Analysis")
-        self.details_text = scrolledtext.ScrolledText(
-            details_frame,
-            wrap=tk.WORD,
-            font=('Consolas', 9),
-            bg='white',
-            fg='#2c3e50',
-            padx=10,
-            pady=10
-        )
-        self.details_text.pack(fill=tk.BOTH, expand=True)
+        for title, _, _, _ in REPORT_SECTIONS:
+            self.notebook.add(ttk.Frame(self.notebook, height=0), text=title)
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
         
-        # Recommendations tab
-        rec_frame = tk.Frame(notebook, bg='white')
-        notebook.add(rec_frame, text="Recommendations")
-        self.rec_text = scrolledtext.ScrolledText(
-            rec_frame,
+        self.report_text = scrolledtext.ScrolledText(
+            results_frame,
             wrap=tk.WORD,
-            font=('Arial', 10),
+            font=('Consolas', 10),
             bg='white',
             fg='#2c3e50',
             padx=10,
-            pady=10
+            pady=10,
+            state=tk.DISABLED  # read-only, so it always matches self._rendered
         )
-        self.rec_text.pack(fill=tk.BOTH, expand=True)
+        self.report_text.pack(fill=tk.BOTH, expand=True)
+        for _, tag, _, font in REPORT_SECTIONS:
+            self.report_text.tag_configure(tag, font=font)
         
         # Export buttons
-        export_frame = tk.Frame(main_frame, bg='#f0f0f0')
+        export_frame = ttk.Frame(main_frame)
         export_frame.pack(fill=tk.X)
         
-        export_json_btn = tk.Button(
-            export_frame,
-            text="💾 Export JSON",
-            command=lambda: self.export_report('json'),
-            font=('Arial', 10),
-            bg='#27ae60',
-            fg='white',
-            activebackground='#229954',
-            padx=15,
-            pady=8,
-            cursor='hand2'
-        )
+        export_json_btn = _mkbutton(export_frame, "💾 Export JSON",
+                                    lambda: self.export_report('json'), style='Export.TButton')
         export_json_btn.pack(side=tk.LEFT, padx=(0, 10))
         
-        export_txt_btn = tk.Button(
+        export_txt_btn = _mkbutton(export_frame, "📄 Export Text",
+                                   lambda: self.export_report('txt'), style='Export.TButton')
+        export_txt_btn.pack(side=tk.LEFT)
+        self._export_buttons = (export_json_btn, export_txt_btn)
+        
+        self.clear_after_export_var = tk.BooleanVar()
+        clear_check = ttk.Checkbutton(
             export_frame,
-            text="📄 Export Text",
-            command=lambda: self.export_report('txt'),
-            font=('Arial', 10),
-            bg='#27ae60',
-            fg='white',
-            activebackground='#229954',
-            padx=15,
-            pady=8,
-            cursor='hand2'
+            text="Clear after export",
+            variable=self.clear_after_export_var
         )
-        export_txt_btn.pack(side=tk.LEFT)
+        clear_check.pack(side=tk.RIGHT)
         
         # Status bar
-        self.status_label = tk.Label(
+        self.status_label = ttk.Label(
             self.root,
             text="Ready - Enter a password to analyze",
-            font=('Arial', 9),
-            bg='#34495e',
-            fg='white',
-            anchor=tk.W,
-            padx=10,
-            pady=5
+            style='Status.TLabel',
+            anchor=tk.W
         )
         self.status_label.pack(side=tk.BOTTOM, fill=tk.X)
         
         self.current_report = None
+        
+        self._init_progress_styles()
+    
+    def _init_styles(self):
+        """Create the shared fonts and ttk widget styles once."""
+        # Named fonts, referenced by name from styles and widgets; Tk deletes
+        # a named font when its Font object is collected, so keep references
+        self._fonts = (
+            tkfont.Font(root=self.root, name='TitleFont', family='Arial', size=16, weight='bold'),
+            tkfont.Font(root=self.root, name='HeadingFont', family='Arial', size=12, weight='bold'),
+            tkfont.Font(root=self.root, name='BodyFont', family='Arial', size=10),
+        )
+        
+        s = ttk.Style()
+        if s.theme_use() != 'clam':
+            s.theme_use('clam')
+        
+        s.configure('.', background='#f0f0f0', font='BodyFont')
+        s.configure('TLabelframe.Label', foreground='#2c3e50', font='HeadingFont')
+        s.configure('Header.TLabel', background='#2c3e50', foreground='white', font='TitleFont')
+        s.configure('Subheader.TLabel', background='#2c3e50', foreground='#ecf0f1')
+        s.configure('Score.TLabel', foreground='#7f8c8d', font='TitleFont')
+        s.configure('Status.TLabel', background='#34495e', foreground='white', padding=(10, 5))
+        
+        s.configure('Primary.TButton', background='#3498db', foreground='white',
+                    font='HeadingFont', padding=(20, 10))
+        s.map('Primary.TButton', background=[('active', '#2980b9')])
+        s.configure('Export.TButton', background='#27ae60', foreground='white', padding=(15, 8))
+        s.map('Export.TButton', background=[('active', '#229954')])
+    
+    def _init_progress_styles(self):
+        """Configure the colored progress bar styles once."""
+        s = ttk.Style()
+        
+        for style, (_, color) in zip(PROGRESS_STYLES, PROGRESS_COLORS):
+            s.configure(style,
+                       background=color,
+                       troughcolor='#ecf0f1',
+                       borderwidth=0,
+                       lightcolor=color,
+                       darkcolor=color)
+    
+    def toggle_live_analysis(self):
+        """Register or remove the password trace that drives live analysis."""
+        if self.live_analysis_var.get():
+            if self._password_trace is None:
+                self._password_trace = self.password_var.trace_add('write', self.on_password_change)
+        elif self._password_trace is not None:
+            self.password_var.trace_remove('write', self._password_trace)
+            self._password_trace = None
+            if self._pending_after is not None:
+                self.root.after_cancel(self._pending_after)
+                self._pending_after = None
     
     def toggle_password_visibility(self):
         """Toggle password visibility."""
@@ -255,9 +408,10 @@ class PasswordStrengthGUI:
             self.password_entry.config(show='*')
     
     def on_password_change(self, *args):
-        """Called when password changes."""
-        # Auto-analyze on change (optional - can be removed if too resource-intensive)
-        pass
+        """Called when password changes; schedules a debounced analysis."""
+        if self._pending_after is not None:
+            self.root.after_cancel(self._pending_after)
+        self._pending_after = self.root.after(self.ANALYZE_DELAY_MS, self._submit_analysis)
     
     def analyze_password(self):
         """Analyze the entered password."""
@@ -267,195 +421,212 @@ class PasswordStrengthGUI:
             messagebox.showwarning("Warning", "Please enter a password to analyze.")
             return
         
+        if self._pending_after is not None:
+            self.root.after_cancel(self._pending_after)
+        self._submit_analysis()
+    
+    def _get_executor(self):
+        """Return the background worker, creating it on first use."""
+        if self._executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+            self._executor = ThreadPoolExecutor(max_workers=1)
+        return self._executor
+    
+    def _submit_analysis(self):
+        """Hand the current password to the worker thread."""
+        self._pending_after = None
+        password = self.password_var.get()
+        if not password:
+            return
+        
+        self.status_label.config(text="Analyzing password...")
+        self._in_flight += 1
+        self.analyze_btn.state(['disabled'])
+        future = self._get_executor().submit(
+            self._analyze, password[:self.MAX_ANALYZE_LEN], len(password))
+        future.add_done_callback(
+            lambda f: self.root.after(0, self._apply_result, f, password)
+        )
+    
+    def _analyze(self, password: str, full_length: int) -> tuple:
+        """Analyze a password on the worker; returns (digest, report)."""
+        report = self.checker.analyze(password)
+        if full_length > len(password):
+            report['truncated_from'] = full_length
+        return password_digest(password), report
+    
+    def _apply_result(self, future, password: str):
+        """Display a finished analysis unless the password has since changed."""
+        self._in_flight -= 1
+        if not self._in_flight:
+            self.analyze_btn.state(['!disabled'])
+        
+        if password != self.password_var.get():
+            return
+        
         try:
-            self.status_label.config(text="Analyzing password...")
-            self.root.update()
-            
-            # Perform analysis
-            report = self.checker.analyze(password)
-            self.current_report = report
-            
-            # Update UI
-            self.update_display(report)
-            
-            self.status_label.config(text="Analysis complete!")
-            
+            key, report = future.result()
         except Exception as e:
             messagebox.showerror("Error", f"An error occurred: {str(e)}")
             self.status_label.config(text="Error during analysis")
+            return
+        
+        self.current_report = report
+        self.update_display(report, key)
+        self.status_label.config(text="Analysis complete!")
     
-    def update_display(self, report: dict):
-        """Update the display with analysis results."""
+    def update_display(self, report: dict, key: bytes = None):
+        """
+        Update the display with analysis results.
+        
+        key is the analyzed password's digest; when given, formatted sections
+        are cached under it and reused when the same password comes back.
+        """
         # Update score and category
         score = report['score']
         category = report['category']
         
         self.score_label.config(text=f"Score: {score:.1f}/100")
-        self.category_label.config(text=f"Category: {category}")
+        if category != self._last_category:
+            self.category_label.config(text=f"Category: {category}")
+            self._last_category = category
         
         # Update progress bar with color
         self.progress_bar['value'] = score
         self.update_progress_color(score)
         
-        # Update overview tab
-        self.overview_text.delete(1.0, tk.END)
-        overview_content = self.format_overview(report)
-        self.overview_text.insert(1.0, overview_content)
-        
-        # Update details tab
-        self.details_text.delete(1.0, tk.END)
-        details_content = self.format_details(report)
-        self.details_text.insert(1.0, details_content)
+        # Update the report text and re-tag its sections
+        sections = [self._render(key, tag, report, getattr(self, formatter))
+                    for _, tag, formatter, _ in REPORT_SECTIONS]
+        if report.get('truncated_from'):
+            # Added outside the cached overview, which depends only on the
+            # analyzed prefix
+            sections[0] += TRUNCATION_NOTE.format_map(report)
+        self._set_report_text(SECTION_GAP.join(sections))
+        
+        offset = 0
+        for (_, tag, _, _), section in zip(REPORT_SECTIONS, sections):
+            section_len = _tk_len(section)
+            start = f"1.0 + {offset} chars"
+            end = f"1.0 + {offset + section_len} chars"
+            self.report_text.tag_remove(tag, "1.0", tk.END)
+            self.report_text.tag_add(tag, start, end)
+            self.report_text.mark_set(f"{tag}_start", start)
+            self.report_text.mark_gravity(f"{tag}_start", tk.LEFT)
+            offset += section_len + len(SECTION_GAP)
+    
+    def _render(self, key: bytes, tag: str, report: dict, formatter) -> str:
+        """Format a report section, reusing the text from an earlier display."""
+        if key is None:
+            return formatter(report)
+        
+        content = self._format_cache.get((key, tag))
+        if content is None:
+            if len(self._format_cache) >= 3 * self.CACHE_SIZE:
+                self._format_cache.clear()
+            content = self._format_cache[(key, tag)] = formatter(report)
+        return content
+    
+    def _on_tab_changed(self, event=None):
+        """Scroll the report text to the section of the selected tab."""
+        if not self._rendered:
+            return
+        _, tag, _, _ = REPORT_SECTIONS[self.notebook.index('current')]
+        self.report_text.yview(f"{tag}_start")
+    
+    def _set_report_text(self, content: str):
+        """Replace the report text, rewriting only the changed tail."""
+        old = self._rendered
+        if old == content:
+            return
         
-        # Update recommendations tab
-        self.rec_text.delete(1.0, tk.END)
-        rec_content = self.format_recommendations(report)
-        self.rec_text.insert(1.0, rec_content)
+        prefix = _common_prefix_len(old, content)
+        self.report_text.config(state=tk.NORMAL)
+        self.report_text.delete(f"1.0 + {_tk_len(old[:prefix])} chars", tk.END)
+        self.report_text.insert(tk.END, content[prefix:])
+        self.report_text.config(state=tk.DISABLED)
+        self._rendered = content
     
     def update_progress_color(self, score: float):
         """Update progress bar color based on score."""
-        if score < 30:
-            style = 'red.Horizontal.TProgressbar'
-        elif score < 50:
-            style = 'orange.Horizontal.TProgressbar'
-        elif score < 70:
-            style = 'yellow.Horizontal.TProgressbar'
-        elif score < 90:
-            style = 'lightgreen.Horizontal.TProgressbar'
-        else:
-            style = 'green.Horizontal.TProgressbar'
-        
-        # Configure progress bar style
-        s = ttk.Style()
-        s.theme_use('clam')
-        
-        color_map = {
-            'red': '#e74c3c',
-            'orange': '#f39c12',
-            'yellow': '#f1c40f',
-            'lightgreen': '#2ecc71',
-            'green': '#27ae60'
-        }
-        
-        for name, color in color_map.items():
-            s.configure(f'{name}.Horizontal.TProgressbar',
-                       background=color,
-                       troughcolor='#ecf0f1',
-                       borderwidth=0,
-                       lightcolor=color,
-                       darkcolor=color)
-        
-        self.progress_bar.config(style=style)
+        band = bisect_right(SCORE_BANDS, score)
+        if band == self._last_band:
+            return
+        self.progress_bar.config(style=PROGRESS_STYLES[band])
+        self._last_band = band
     
-    def format_overview(self, report: dict) -> str:
+    @staticmethod
+    def format_overview(report: dict) -> str:
         """Format overview content."""
-        lines = [
-            "PASSWORD STRENGTH OVERVIEW",
-            "=" * 50,
-            "",
-            f"Password Length: {report['length']} characters",
-            f"Entropy: {report['entropy_bits']} bits",
-            f"Strength Score: {report['score']:.2f}/100",
-            f"Category: {report['category']}",
-            "",
-            "CRACKING TIME ESTIMATES:",
-            "-" * 50,
-            f"Online Brute-Force:  {report['cracking_time'].get('online_brute_force', 'N/A')}",
-            f"Offline CPU Attack:  {report['cracking_time'].get('offline_cpu', 'N/A')}",
-            f"Offline GPU Attack:  {report['cracking_time'].get('offline_gpu', 'N/A')}",
-            f"Cloud Cracking:      {report['cracking_time'].get('cloud_cracking', 'N/A')}",
-            "",
-            "CHARACTER COMPOSITION:",
-            "-" * 50,
-        ]
-        
+        ct = report['cracking_time']
         ca = report.get('character_analysis', {})
-        lines.extend([
-            f"✓ Lowercase letters: {ca.get('lowercase_count', 0)}",
-            f"✓ Uppercase letters: {ca.get('uppercase_count', 0)}",
-            f"✓ Digits:            {ca.get('digit_count', 0)}",
-            f"✓ Special symbols:   {ca.get('symbol_count', 0)}",
-            f"Character set size:  {ca.get('character_set_size', 0)}",
-        ])
-        
-        return "\n".join(lines)
+        return OVERVIEW_TEMPLATE.format_map({
+            'rule': RULE_50,
+            'dash': DASH_50,
+            'length': report['length'],
+            'entropy_bits': report['entropy_bits'],
+            'score': report['score'],
+            'category': report['category'],
+            'online': ct.get('online_brute_force', 'N/A'),
+            'cpu': ct.get('offline_cpu', 'N/A'),
+            'gpu': ct.get('offline_gpu', 'N/A'),
+            'cloud': ct.get('cloud_cracking', 'N/A'),
+            'lowercase': ca.get('lowercase_count', 0),
+            'uppercase': ca.get('uppercase_count', 0),
+            'digits': ca.get('digit_count', 0),
+            'symbols': ca.get('symbol_count', 0),
+            'charset': ca.get('character_set_size', 0),
+        })
     
-    def format_details(self, report: dict) -> str:
+    @staticmethod
+    def format_details(report: dict) -> str:
         """Format detailed analysis content."""
-        lines = [
-            "DETAILED PASSWORD ANALYSIS",
-            "=" * 60,
-            "",
-            "PATTERNS DETECTED:",
-            "-" * 60,
-        ]
+        ct = report['cracking_time']
+        lines = []
         
         patterns = report.get('patterns_detected', {})
-        pattern_found = False
-        
         for pattern_type, pattern_list in patterns.items():
             if pattern_list:
-                pattern_found = True
-                lines.append(f"\n{pattern_type.replace('_', ' ').title()}:")
-                for pattern in pattern_list:
-                    lines.append(f"  • {pattern}")
+                title = PATTERN_LABELS.get(pattern_type) or pattern_type.replace('_', ' ').title()
+                lines.append(f"\n{title}:\n  • " + "\n  • ".join(pattern_list))
         
-        if not pattern_found:
+        if not lines:
             lines.append("✓ No weak patterns detected")
+        pattern_content = "\n".join(lines)
         
-        lines.append("")
-        lines.append("DICTIONARY CHECK:")
-        lines.append("-" * 60)
-        
+        lines = []
         dc = report.get('dictionary_check', {})
-        if dc.get('is_common_password'):
+        is_common = dc.get('is_common_password')
+        has_word = dc.get('contains_dictionary_word')
+        has_substitution = dc.get('contains_substituted_word')
+        if is_common:
             lines.append("⚠️  WARNING: This is a common password!")
-        if dc.get('contains_dictionary_word'):
-            words = dc.get('dictionary_words_found', [])
-            lines.append(f"⚠️  Dictionary words found: {', '.join(words)}")
-        if dc.get('contains_substituted_word'):
+        if has_word:
+            lines.append(f"⚠️  Dictionary words found: {', '.join(dc.get('dictionary_words_found', []))}")
+        if has_substitution:
             lines.append("⚠️  Character substitution detected (e.g., @ for a)")
-        if not any([dc.get('is_common_password'), dc.get('contains_dictionary_word'),
-                   dc.get('contains_substituted_word')]):
+        if not (is_common or has_word or has_substitution):
             lines.append("✓ No dictionary words detected")
         
-        lines.append("")
-        lines.append("ENTROPY ANALYSIS:")
-        lines.append("-" * 60)
-        lines.append(f"Entropy: {report['entropy_bits']} bits")
-        lines.append(f"Possible combinations: {report['cracking_time'].get('combinations', 'N/A')}")
-        
-        return "\n".join(lines)
+        return DETAILS_TEMPLATE.format_map({
+            'rule': RULE_60,
+            'dash': DASH_60,
+            'patterns': pattern_content,
+            'dictionary': "\n".join(lines),
+            'entropy_bits': report['entropy_bits'],
+            'combinations': ct.get('combinations', 'N/A'),
+        })
     
-    def format_recommendations(self, report: dict) -> str:
+    @staticmethod
+    def format_recommendations(report: dict) -> str:
         """Format recommendations content."""
-        lines = [
-            "SECURITY RECOMMENDATIONS",
-            "=" * 60,
-            "",
-        ]
-        
         recommendations = report.get('recommendations', [])
         if recommendations:
-            for i, rec in enumerate(recommendations, 1):
-                lines.append(f"{i}. {rec}")
+            rec_content = "\n".join(f"{i}. {rec}" for i, rec in enumerate(recommendations, 1))
         else:
-            lines.append("No specific recommendations. Password appears strong!")
-        
-        lines.append("")
-        lines.append("GENERAL PASSWORD SECURITY TIPS:")
-        lines.append("-" * 60)
-        lines.extend([
-            "• Use unique passwords for each account",
-            "• Never share your passwords with anyone",
-            "• Consider using a password manager",
-            "• Enable two-factor authentication when available",
-            "• Change passwords if you suspect a breach",
-            "• Avoid using personal information (names, dates, etc.)",
-            "• Use passphrases for better memorability and security"
-        ])
-        
-        return "\n".join(lines)
+            rec_content = "No specific recommendations. Password appears strong!"
+        
+        return RECOMMENDATIONS_HEADER + rec_content + SECURITY_TIPS
     
     def export_report(self, format_type: str):
         """Export report to file."""
@@ -463,6 +634,8 @@ class PasswordStrengthGUI:
             messagebox.showwarning("Warning", "Please analyze a password first.")
             return
         
+        from tkinter import filedialog
+        
         # Get filename from user
         if format_type == 'json':
             filename = filedialog.asksaveasfilename(
@@ -475,13 +648,51 @@ class PasswordStrengthGUI:
                 filetypes=[("Text files", "*.txt"), ("All files", "*.*")]
             )
         
-        if filename:
-            try:
-                self.checker.export_report(self.current_report, filename, format_type)
-                messagebox.showinfo("Success", f"Report exported successfully to:\n{filename}")
-                self.status_label.config(text=f"Report exported to {filename}")
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to export report: {str(e)}")
+        if not filename:
+            return
+        
+        # Write the file on the worker thread; the result is handled back on
+        # the Tk thread in _on_export_done
+        for btn in self._export_buttons:
+            btn.state(['disabled'])
+        self.status_label.config(text="Exporting report...")
+        future = self._get_executor().submit(
+            self.checker.export_report, self.current_report, filename, format_type
+        )
+        future.add_done_callback(
+            lambda f: self.root.after(0, self._on_export_done, f, filename)
+        )
+    
+    def _on_export_done(self, future, filename: str):
+        """Report the outcome of a background export."""
+        for btn in self._export_buttons:
+            btn.state(['!disabled'])
+        
+        try:
+            future.result()
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to export report: {str(e)}")
+            self.status_label.config(text="Export failed")
+            return
+        
+        messagebox.showinfo("Success", f"Report exported successfully to:\n{filename}")
+        self.status_label.config(text=f"Report exported to {filename}")
+        
+        if self.clear_after_export_var.get():
+            self.clear_password()
+    
+    def clear_password(self):
+        """Drop the entered password and the report built from it."""
+        self.password_var.set("")
+        self.current_report = None
+        self.checker.clear_cache()
+        self._format_cache.clear()
+        
+        self._set_report_text("")
+        self.score_label.config(text="Score: --/100")
+        self.category_label.config(text="Category: --")
+        self._last_category = None
+        self.progress_bar['value'] = 0
 
 
 def main():
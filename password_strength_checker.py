@@ -3,14 +3,149 @@ Password Strength Checker - Comprehensive Security Analysis Tool
 Developed for Cybersecurity Education and Awareness
 """
 
+import io
 import re
 import math
 import string
 import hashlib
-import json
+import threading
+from bisect import bisect_right
 from datetime import datetime
-from collections import Counter
-from typing import Dict, List, Tuple, Optional
+from collections import OrderedDict
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Tuple, Optional
+
+try:
+    import ahocorasick  # optional: pip install pyahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import marisa_trie  # optional: pip install marisa-trie
+except ImportError:
+    marisa_trie = None
+
+
+# Maps each ASCII character to a class marker: 'a' lowercase, 'A' uppercase,
+# '0' digit, '!' anything else
+_CHAR_CLASSES = str.maketrans({
+    chr(i): ('a' if chr(i) in string.ascii_lowercase else
+             'A' if chr(i) in string.ascii_uppercase else
+             '0' if chr(i) in string.digits else '!')
+    for i in range(128)
+})
+
+# Ascending runs that sequential digits/letters must be a substring of
+_DIGIT_RUN = string.digits
+_LETTER_RUN = string.ascii_lowercase
+
+# Common weak passwords and keyboard patterns, built once and shared by
+# every checker instance
+_COMMON_PASSWORDS = frozenset({
+    'password', '123456', '12345678', '123456789', '1234567890',
+    'qwerty', 'abc123', 'password1', 'welcome', 'monkey',
+    '1234567', 'letmein', 'trustno1', 'dragon', 'baseball',
+    'iloveyou', 'master', 'sunshine', 'ashley', 'bailey',
+    'passw0rd', 'shadow', '123123', '654321', 'superman',
+    'qazwsx', 'michael', 'football', 'welcome123', 'jesus',
+    'ninja', 'mustang', 'password123', 'admin', 'login'
+})
+_KEYBOARD_PATTERNS = (
+    'qwerty', 'qwertyuiop', 'asdfgh', 'asdfghjkl', 'zxcvbn',
+    '123456', '12345678', '123456789', '1234567890',
+    'abcdef', 'abcdefgh', 'qwerty123', 'asdf123', 'zxcv123'
+)
+
+# Undoes common character substitutions (p@ssw0rd -> password)
+_LEET_TABLE = str.maketrans({'@': 'a', '3': 'e', '1': 'i', '0': 'o', '$': 's', '7': 't'})
+
+# Patterns used by _detect_patterns
+_SEQ_ALPHA_RE = re.compile(r'[a-z]{3,}')
+_DATE_RE = re.compile(r'\d{1,2}[/-]\d{1,2}[/-]\d{2,4}')
+
+# Guesses per second for different attack scenarios (approximate values)
+_GUESS_RATES = (
+    ('online_brute_force', 10),  # rate-limited
+    ('offline_cpu', 1e6),  # 1 million guesses/second
+    ('offline_gpu', 1e9),  # 1 billion guesses/second
+    ('cloud_cracking', 1e12),  # 1 trillion guesses/second
+)
+
+# Upper bounds (exclusive, in seconds) of the cracking time buckets, and the
+# (divisor, unit) each bucket is reported in; the last bucket holds infinity,
+# which is what the estimate becomes once 2 ** entropy overflows a float
+_TIME_BOUNDS = (1, 60, 3600, 86400, 31536000, 3153600000, math.inf)
+_TIME_UNITS = (
+    (None, "Instant"),
+    (1, "seconds"),
+    (60, "minutes"),
+    (3600, "hours"),
+    (86400, "days"),
+    (31536000, "years"),
+    (31536000, "years (centuries)"),
+    (None, "Effectively forever"),
+)
+
+
+def _format_time(seconds: float) -> str:
+    """Format time in human-readable format."""
+    divisor, unit = _TIME_UNITS[bisect_right(_TIME_BOUNDS, seconds)]
+    if divisor is None:
+        return unit
+    return f"{int(seconds/divisor)} {unit}"
+
+
+# Fixed parts of the plain-text export; the pattern, dictionary and
+# recommendation sections are written line by line after them
+_TEXT_REPORT_RULE = "=" * 60
+_TEXT_REPORT_HEADER = """\
+{rule}
+PASSWORD STRENGTH ANALYSIS REPORT
+{rule}
+
+Analysis Date: {timestamp}
+Password Length: {length} characters
+Entropy: {entropy_bits} bits
+Strength Score: {score}/100
+Category: {category}
+
+CRACKING TIME ESTIMATES:
+  Online Brute-Force: {online}
+  Offline CPU: {cpu}
+  Offline GPU: {gpu}
+  Cloud Cracking: {cloud}
+
+CHARACTER ANALYSIS:
+"""
+_TEXT_REPORT_CHARACTERS = """\
+  Lowercase: {has_lower} ({lower} chars)
+  Uppercase: {has_upper} ({upper} chars)
+  Digits: {has_digits} ({digits} chars)
+  Symbols: {has_symbols} ({symbols} chars)
+  Character Set Size: {set_size}
+"""
+
+
+def password_digest(password: str) -> bytes:
+    """Return the digest used to key cached results without keeping the password."""
+    return hashlib.blake2b(password.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+
+
+def _copy_report(report: Dict) -> Dict:
+    """Copy a report down to its nested dicts and lists (values are immutable)."""
+    return {
+        key: (value.copy() if isinstance(value, list) else
+              {k: v.copy() if isinstance(v, list) else v for k, v in value.items()}
+              if isinstance(value, dict) else value)
+        for key, value in report.items()
+    }
+
+
+class PasswordScore(NamedTuple):
+    """Compact per-password result returned by analyze_batch."""
+    length: int
+    entropy_bits: float
+    score: float
+    category: str
 
 
 class PasswordStrengthChecker:
@@ -19,6 +154,9 @@ class PasswordStrengthChecker:
     Analyzes passwords based on length, entropy, patterns, dictionary words, and more.
     """
     
+    # Number of analysis results memoized per checker instance
+    CACHE_SIZE = 4096
+    
     def __init__(self, dictionary_file: Optional[str] = None):
         """
         Initialize the password strength checker.
@@ -28,31 +166,33 @@ class PasswordStrengthChecker:
         """
         self.dictionary_file = dictionary_file
         self.dictionary_words = set()
+        self._word_automaton = None
+        self._max_word_len = 0
         self.common_passwords = self._load_common_passwords()
         self.keyboard_patterns = self._load_keyboard_patterns()
+        # Any-pattern matcher used to rule out most passwords in one search
+        self._keyboard_re = re.compile('|'.join(map(re.escape, self.keyboard_patterns)))
         
         if dictionary_file:
             self._load_dictionary()
+        
+        # Per-instance LRU memo of analysis results, keyed by a digest of the
+        # password so plaintext passwords are never held as keys
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+    
+    def clear_cache(self):
+        """Forget all memoized analysis results."""
+        with self._cache_lock:
+            self._cache.clear()
     
-    def _load_common_passwords(self) -> set:
+    def _load_common_passwords(self) -> frozenset:
         """Load common weak passwords."""
-        return {
-            'password', '123456', '12345678', '123456789', '1234567890',
-            'qwerty', 'abc123', 'password1', 'welcome', 'monkey',
-            '1234567', 'letmein', 'trustno1', 'dragon', 'baseball',
-            'iloveyou', 'master', 'sunshine', 'ashley', 'bailey',
-            'passw0rd', 'shadow', '123123', '654321', 'superman',
-            'qazwsx', 'michael', 'football', 'welcome123', 'jesus',
-            'ninja', 'mustang', 'password123', 'admin', 'login'
-        }
+        return _COMMON_PASSWORDS
     
-    def _load_keyboard_patterns(self) -> List[str]:
+    def _load_keyboard_patterns(self) -> Tuple[str, ...]:
         """Load common keyboard patterns."""
-        return [
-            'qwerty', 'qwertyuiop', 'asdfgh', 'asdfghjkl', 'zxcvbn',
-            '123456', '12345678', '123456789', '1234567890',
-            'abcdef', 'abcdefgh', 'qwerty123', 'asdf123', 'zxcv123'
-        ]
+        return _KEYBOARD_PATTERNS
     
     def _load_dictionary(self):
         """Load dictionary words from file if provided."""
@@ -61,9 +201,56 @@ class PasswordStrengthChecker:
         
         try:
             with open(self.dictionary_file, 'r', encoding='utf-8', errors='ignore') as f:
-                self.dictionary_words = {line.strip().lower() for line in f if line.strip()}
+                words = set(map(str.strip, f.read().lower().splitlines()))
+                words.discard('')
         except FileNotFoundError:
             print(f"Warning: Dictionary file '{self.dictionary_file}' not found.")
+            return
+        
+        # A trie stores large wordlists far more compactly than a set
+        self.dictionary_words = marisa_trie.Trie(words) if marisa_trie is not None else words
+        
+        self._index_dictionary()
+    
+    def _index_dictionary(self):
+        """Prepare substring search over dictionary words of 4+ characters."""
+        words = [word for word in self.dictionary_words if len(word) >= 4]
+        self._max_word_len = max(map(len, words), default=0)
+        
+        if ahocorasick is not None and words:
+            automaton = ahocorasick.Automaton()
+            for word in words:
+                automaton.add_word(word, word)
+            automaton.make_automaton()
+            self._word_automaton = automaton
+    
+    def _find_dictionary_words(self, text: str) -> Iterator[str]:
+        """
+        Yield dictionary words of 4+ characters contained in text.
+        
+        Uses an Aho-Corasick automaton when pyahocorasick is installed,
+        then trie prefix queries when marisa-trie is installed; otherwise
+        looks up every substring up to the longest word length. Either way
+        the cost depends on the text, not the dictionary size.
+        """
+        if self._word_automaton is not None:
+            for _, word in self._word_automaton.iter(text):
+                yield word
+            return
+        
+        words = self.dictionary_words
+        n = len(text)
+        if marisa_trie is not None and isinstance(words, marisa_trie.Trie):
+            for i in range(n - 3):
+                for word in words.prefixes(text[i:]):
+                    if len(word) >= 4:
+                        yield word
+            return
+        
+        for i in range(n - 3):
+            for j in range(i + 4, min(n, i + self._max_word_len) + 1):
+                if text[i:j] in words:
+                    yield text[i:j]
     
     def analyze(self, password: str) -> Dict:
         """
@@ -78,14 +265,68 @@ class PasswordStrengthChecker:
         if not password:
             return self._empty_report()
         
-        # Core analysis
-        length = len(password)
+        key = password_digest(password)
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+        if cached is None:
+            cached = self._analyze_uncached(password)
+            with self._cache_lock:
+                self._cache[key] = cached
+                if len(self._cache) > self.CACHE_SIZE:
+                    self._cache.popitem(last=False)
+        
+        # Cached reports are shared; hand out a copy with a fresh timestamp
+        report = _copy_report(cached)
+        report['timestamp'] = datetime.now().isoformat()
+        return report
+    
+    def analyze_batch(self, passwords: Iterable[str]) -> List[PasswordScore]:
+        """
+        Score many passwords at once, e.g. when auditing a leaked password list.
+        
+        Skips recommendations, cracking time estimates and report assembly,
+        and scores each distinct password only once.
+        
+        Args:
+            passwords: The passwords to score
+            
+        Returns:
+            One PasswordScore (length, entropy_bits, score, category) per
+            password, rounded the same way as in analyze()
+        """
+        scored = {'': PasswordScore(0, 0.0, 0.0, 'Very Weak')}
+        rows = []
+        for password in passwords:
+            row = scored.get(password)
+            if row is None:
+                _, _, _, entropy, score = self._score_password(password)
+                row = scored[password] = PasswordScore(
+                    len(password), round(entropy, 2), round(score, 2), self._categorize_strength(score))
+            rows.append(row)
+        return rows
+    
+    def _score_password(self, password: str) -> Tuple[Dict, Dict, Dict, float, float]:
+        """
+        Run the checks that feed the score, shared by analyze and analyze_batch.
+        
+        Returns:
+            Character analysis, patterns, dictionary check, entropy and score
+        """
         char_analysis = self._analyze_characters(password)
         patterns = self._detect_patterns(password)
         dictionary_check = self._check_dictionary(password)
         entropy = self._calculate_entropy(password, char_analysis)
+        score = self._calculate_score(len(password), char_analysis, patterns, dictionary_check, entropy)
+        return char_analysis, patterns, dictionary_check, entropy, score
+    
+    def _analyze_uncached(self, password: str) -> Dict:
+        """Run the full analysis pipeline for a non-empty password."""
+        # Core analysis
+        length = len(password)
+        char_analysis, patterns, dictionary_check, entropy, score = self._score_password(password)
         cracking_time = self._estimate_cracking_time(entropy)
-        score = self._calculate_score(length, char_analysis, patterns, dictionary_check, entropy)
         category = self._categorize_strength(score)
         
         # Generate comprehensive report
@@ -109,17 +350,22 @@ class PasswordStrengthChecker:
     
     def _analyze_characters(self, password: str) -> Dict:
         """Analyze character composition of password."""
-        has_lower = bool(re.search(r'[a-z]', password))
-        has_upper = bool(re.search(r'[A-Z]', password))
-        has_digit = bool(re.search(r'\d', password))
-        has_symbol = bool(re.search(r'[^a-zA-Z0-9]', password))
-        has_unicode = bool(re.search(r'[^\x00-\x7F]', password))
-        
-        # Count character types
-        lowercase_count = len(re.findall(r'[a-z]', password))
-        uppercase_count = len(re.findall(r'[A-Z]', password))
-        digit_count = len(re.findall(r'\d', password))
-        symbol_count = len(re.findall(r'[^a-zA-Z0-9]', password))
+        # One translate pass maps every ASCII character to its class marker;
+        # non-ASCII characters pass through unchanged and count as symbols
+        classes = password.translate(_CHAR_CLASSES)
+        lowercase_count = classes.count('a')
+        uppercase_count = classes.count('A')
+        digit_count = classes.count('0')
+        symbol_count = len(password) - lowercase_count - uppercase_count - digit_count
+        has_unicode = not password.isascii()
+        if has_unicode:
+            # Non-ASCII decimal digits count as digits as well as symbols
+            digit_count += sum(1 for c in password if c.isdecimal() and not c.isascii())
+        
+        has_lower = lowercase_count > 0
+        has_upper = uppercase_count > 0
+        has_digit = digit_count > 0
+        has_symbol = symbol_count > 0
         
         # Calculate character set size
         char_set_size = 0
@@ -150,19 +396,8 @@ class PasswordStrengthChecker:
     
     def _calculate_diversity(self, lower: bool, upper: bool, digit: bool, symbol: bool, unicode: bool) -> float:
         """Calculate character diversity score (0-100)."""
-        types = sum([lower, upper, digit, symbol, unicode])
-        if types == 0:
-            return 0
-        elif types == 1:
-            return 20
-        elif types == 2:
-            return 40
-        elif types == 3:
-            return 60
-        elif types == 4:
-            return 80
-        else:  # 5 types
-            return 100
+        # 20 points per character type present (booleans add as 0/1)
+        return 20 * (lower + upper + digit + symbol + unicode)
     
     def _detect_patterns(self, password: str) -> Dict:
         """Detect common weak patterns in password."""
@@ -177,39 +412,63 @@ class PasswordStrengthChecker:
         
         password_lower = password.lower()
         
-        # Sequential digits (123, 1234, etc.)
-        sequential_digit = re.findall(r'\d{3,}', password)
-        for seq in sequential_digit:
-            if self._is_sequential(seq, True):
-                patterns['sequential_digits'].append(seq)
-        
-        # Sequential letters (abc, abcd, etc.)
-        sequential_letter = re.findall(r'[a-z]{3,}', password_lower)
-        for seq in sequential_letter:
-            if self._is_sequential(seq, False):
-                patterns['sequential_letters'].append(seq)
-        
-        # Repetitive characters (aaa, 111, etc.)
-        repetitive = re.findall(r'(.)\1{2,}', password)
-        patterns['repetitive_chars'] = [match[0] * len(match.group()) for match in re.finditer(r'(.)\1{2,}', password)]
-        
-        # Keyboard patterns
-        for pattern in self.keyboard_patterns:
-            if pattern in password_lower:
-                patterns['keyboard_patterns'].append(pattern)
-        
-        # Date patterns (YYYY, YYYY-MM-DD, etc.)
-        date_patterns = [
-            r'\d{4}',  # Year
-            r'\d{1,2}[/-]\d{1,2}[/-]\d{2,4}',  # Date format
-        ]
-        for pattern in date_patterns:
-            matches = re.findall(pattern, password)
-            if matches:
-                patterns['date_patterns'].extend(matches)
+        # One left-to-right pass tracks the current digit run, lowercase
+        # letter run and repeated-character run; each run is examined when
+        # it ends (the index one past the end acts as a final terminator)
+        length = len(password)
+        same_length = len(password_lower) == length
+        digit_start = letter_start = repeat_start = 0
+        for i in range(length + 1):
+            char = password[i] if i < length else ''
+            
+            # Sequential digits (123, 1234, etc.) and years (YYYY)
+            if not char.isdecimal():
+                run_length = i - digit_start
+                if run_length >= 3:
+                    run = password[digit_start:i]
+                    if self._is_sequential(run, True):
+                        patterns['sequential_digits'].append(run)
+                    for j in range(digit_start, i - 3, 4):
+                        patterns['date_patterns'].append(password[j:j + 4])
+                digit_start = i + 1
+            
+            # Sequential letters (abc, abcd, etc.)
+            if same_length:
+                lower = password_lower[i] if i < length else ''
+                if not ('a' <= lower <= 'z'):
+                    if i - letter_start >= 3:
+                        run = password_lower[letter_start:i]
+                        if self._is_sequential(run, False):
+                            patterns['sequential_letters'].append(run)
+                    letter_start = i + 1
+            
+            # Repetitive characters (aaa, 111, etc.)
+            if i == length or char != password[repeat_start]:
+                if i - repeat_start >= 3 and password[repeat_start] != '\n':
+                    patterns['repetitive_chars'].append(password[repeat_start:i])
+                repeat_start = i
+        
+        # Lowercasing can change the length of some non-ASCII text, in which
+        # case letter runs have to be found in the lowered string itself
+        if not same_length:
+            for run in _SEQ_ALPHA_RE.findall(password_lower):
+                if self._is_sequential(run, False):
+                    patterns['sequential_letters'].append(run)
+        
+        # Keyboard patterns; patterns nest (qwerty, qwerty123), so a hit on
+        # the combined regex is followed by a check of each pattern
+        if self._keyboard_re.search(password_lower):
+            for pattern in self.keyboard_patterns:
+                if pattern in password_lower:
+                    patterns['keyboard_patterns'].append(pattern)
+        
+        # Date formats (DD/MM/YYYY, MM-DD-YY, etc.)
+        if '/' in password or '-' in password:
+            patterns['date_patterns'].extend(_DATE_RE.findall(password))
         
         # Common weak patterns
-        if re.search(r'^(.)\1+$', password):  # All same character
+        if (length > 1 and password[0] != '\n'
+                and password.count(password[0]) == length):  # All same character
             patterns['common_patterns'].append('All same character')
         if password.isdigit():
             patterns['common_patterns'].append('All digits')
@@ -224,15 +483,11 @@ class PasswordStrengthChecker:
             return False
         
         if is_digit:
-            for i in range(len(sequence) - 1):
-                if int(sequence[i+1]) - int(sequence[i]) != 1:
-                    return False
-        else:
-            for i in range(len(sequence) - 1):
-                if ord(sequence[i+1]) - ord(sequence[i]) != 1:
-                    return False
-        
-        return True
+            if not sequence.isascii():
+                # Normalize non-ASCII decimal digits matched by \d
+                sequence = ''.join(str(int(c)) for c in sequence)
+            return sequence in _DIGIT_RUN
+        return sequence in _LETTER_RUN
     
     def _check_dictionary(self, password: str) -> Dict:
         """Check password against dictionary words and common passwords."""
@@ -260,12 +515,15 @@ class PasswordStrengthChecker:
                 findings['contains_dictionary_word'] = True
                 findings['dictionary_words_found'].append(password_lower)
             
-            # Check if password contains dictionary words
-            for word in self.dictionary_words:
-                if len(word) >= 4 and word in password_lower:
-                    findings['contains_dictionary_word'] = True
-                    if word not in findings['dictionary_words_found']:
-                        findings['dictionary_words_found'].append(word)
+            # Check if password contains dictionary words; a set of the words
+            # already listed keeps the duplicate check O(1) per match
+            words_found = findings['dictionary_words_found']
+            seen = set(words_found)
+            for word in self._find_dictionary_words(password_lower):
+                findings['contains_dictionary_word'] = True
+                if word not in seen:
+                    seen.add(word)
+                    words_found.append(word)
             
             # Check reversed words
             if password_reversed in self.dictionary_words:
@@ -273,12 +531,7 @@ class PasswordStrengthChecker:
                 findings['dictionary_words_found'].append(f"{password_reversed} (reversed)")
         
         # Check for common substitutions (p@ssw0rd, etc.)
-        substitutions = {
-            'a': '@', 'e': '3', 'i': '1', 'o': '0', 's': '$', 't': '7'
-        }
-        substituted_word = password_lower
-        for char, sub in substitutions.items():
-            substituted_word = substituted_word.replace(sub, char)
+        substituted_word = password_lower.translate(_LEET_TABLE)
         
         if substituted_word in self.dictionary_words or substituted_word in self.common_passwords:
             findings['contains_substituted_word'] = True
@@ -306,40 +559,17 @@ class PasswordStrengthChecker:
         Estimate time to crack password based on entropy.
         Assumes different attack scenarios.
         """
-        # Guesses per second for different scenarios
-        # These are approximate values
-        online_brute_force = 10  # 10 guesses/second (rate-limited)
-        offline_cpu = 1e6  # 1 million guesses/second
-        offline_gpu = 1e9  # 1 billion guesses/second
-        cloud_cracking = 1e12  # 1 trillion guesses/second
-        
-        # Total possible combinations
-        combinations = 2 ** entropy
-        
-        def format_time(seconds: float) -> str:
-            """Format time in human-readable format."""
-            if seconds < 1:
-                return "Instant"
-            elif seconds < 60:
-                return f"{int(seconds)} seconds"
-            elif seconds < 3600:
-                return f"{int(seconds/60)} minutes"
-            elif seconds < 86400:
-                return f"{int(seconds/3600)} hours"
-            elif seconds < 31536000:
-                return f"{int(seconds/86400)} days"
-            elif seconds < 3153600000:
-                return f"{int(seconds/31536000)} years"
-            else:
-                return f"{int(seconds/31536000)} years (centuries)"
-        
-        return {
-            'online_brute_force': format_time(combinations / online_brute_force),
-            'offline_cpu': format_time(combinations / offline_cpu),
-            'offline_gpu': format_time(combinations / offline_gpu),
-            'cloud_cracking': format_time(combinations / cloud_cracking),
-            'combinations': f"{combinations:.2e}"
-        }
+        # Total possible combinations (float base: one float pow, no int dispatch);
+        # past ~1024 bits this exceeds the float range
+        try:
+            combinations = 2.0 ** entropy
+        except OverflowError:
+            combinations = math.inf
+        
+        cracking_time = {scenario: _format_time(combinations / rate)
+                         for scenario, rate in _GUESS_RATES}
+        cracking_time['combinations'] = f"{combinations:.2e}"
+        return cracking_time
     
     def _calculate_score(self, length: int, char_analysis: Dict, patterns: Dict,
                         dictionary_check: Dict, entropy: float) -> float:
@@ -481,6 +711,7 @@ class PasswordStrengthChecker:
             format: Export format ('json', 'txt')
         """
         if format.lower() == 'json':
+            import json  # only needed for exports; keeps analyze-only imports light
             with open(filename, 'w', encoding='utf-8') as f:
                 json.dump(report, f, indent=2, ensure_ascii=False)
         elif format.lower() == 'txt':
@@ -491,70 +722,66 @@ class PasswordStrengthChecker:
     
     def _format_text_report(self, report: Dict) -> str:
         """Format report as human-readable text."""
-        lines = [
-            "=" * 60,
-            "PASSWORD STRENGTH ANALYSIS REPORT",
-            "=" * 60,
-            "",
-            f"Analysis Date: {report['timestamp']}",
-            f"Password Length: {report['length']} characters",
-            f"Entropy: {report['entropy_bits']} bits",
-            f"Strength Score: {report['score']}/100",
-            f"Category: {report['category']}",
-            "",
-            "CRACKING TIME ESTIMATES:",
-            f"  Online Brute-Force: {report['cracking_time'].get('online_brute_force', 'N/A')}",
-            f"  Offline CPU: {report['cracking_time'].get('offline_cpu', 'N/A')}",
-            f"  Offline GPU: {report['cracking_time'].get('offline_gpu', 'N/A')}",
-            f"  Cloud Cracking: {report['cracking_time'].get('cloud_cracking', 'N/A')}",
-            "",
-            "CHARACTER ANALYSIS:",
-        ]
+        ct = report['cracking_time']
+        out = io.StringIO()
+        write = out.write
+        write(_TEXT_REPORT_HEADER.format_map({
+            'rule': _TEXT_REPORT_RULE,
+            'timestamp': report['timestamp'],
+            'length': report['length'],
+            'entropy_bits': report['entropy_bits'],
+            'score': report['score'],
+            'category': report['category'],
+            'online': ct.get('online_brute_force', 'N/A'),
+            'cpu': ct.get('offline_cpu', 'N/A'),
+            'gpu': ct.get('offline_gpu', 'N/A'),
+            'cloud': ct.get('cloud_cracking', 'N/A'),
+        }))
         
         if 'character_analysis' in report:
             ca = report['character_analysis']
-            lines.extend([
-                f"  Lowercase: {ca.get('has_lowercase', False)} ({ca.get('lowercase_count', 0)} chars)",
-                f"  Uppercase: {ca.get('has_uppercase', False)} ({ca.get('uppercase_count', 0)} chars)",
-                f"  Digits: {ca.get('has_digits', False)} ({ca.get('digit_count', 0)} chars)",
-                f"  Symbols: {ca.get('has_symbols', False)} ({ca.get('symbol_count', 0)} chars)",
-                f"  Character Set Size: {ca.get('character_set_size', 0)}",
-            ])
-        
-        lines.append("")
-        lines.append("PATTERNS DETECTED:")
+            write(_TEXT_REPORT_CHARACTERS.format_map({
+                'has_lower': ca.get('has_lowercase', False),
+                'lower': ca.get('lowercase_count', 0),
+                'has_upper': ca.get('has_uppercase', False),
+                'upper': ca.get('uppercase_count', 0),
+                'has_digits': ca.get('has_digits', False),
+                'digits': ca.get('digit_count', 0),
+                'has_symbols': ca.get('has_symbols', False),
+                'symbols': ca.get('symbol_count', 0),
+                'set_size': ca.get('character_set_size', 0),
+            }))
+        
+        write("\nPATTERNS DETECTED:\n")
         if 'patterns_detected' in report:
             patterns = report['patterns_detected']
             if any(patterns.values()):
                 for pattern_type, pattern_list in patterns.items():
                     if pattern_list:
-                        lines.append(f"  {pattern_type.replace('_', ' ').title()}: {', '.join(pattern_list)}")
+                        write(f"  {pattern_type.replace('_', ' ').title()}: {', '.join(pattern_list)}\n")
             else:
-                lines.append("  No weak patterns detected")
+                write("  No weak patterns detected\n")
         
-        lines.append("")
-        lines.append("DICTIONARY CHECK:")
+        write("\nDICTIONARY CHECK:\n")
         if 'dictionary_check' in report:
             dc = report['dictionary_check']
             if dc.get('is_common_password'):
-                lines.append("  ⚠️  Common password detected!")
+                write("  ⚠️  Common password detected!\n")
             if dc.get('contains_dictionary_word'):
-                lines.append(f"  ⚠️  Dictionary words found: {', '.join(dc.get('dictionary_words_found', []))}")
+                write(f"  ⚠️  Dictionary words found: {', '.join(dc.get('dictionary_words_found', []))}\n")
             if dc.get('contains_substituted_word'):
-                lines.append("  ⚠️  Character substitution detected")
+                write("  ⚠️  Character substitution detected\n")
             if not any([dc.get('is_common_password'), dc.get('contains_dictionary_word'),
                        dc.get('contains_substituted_word')]):
-                lines.append("  ✓ No dictionary words detected")
+                write("  ✓ No dictionary words detected\n")
         
-        lines.append("")
-        lines.append("RECOMMENDATIONS:")
+        write("\nRECOMMENDATIONS:\n")
         for rec in report.get('recommendations', []):
-            lines.append(f"  • {rec}")
-        
-        lines.append("")
-        lines.append("=" * 60)
+            write(f"  • {rec}\n")
         
-        return "\n".join(lines)
+        write("\n")
+        write(_TEXT_REPORT_RULE)
+        return out.getvalue()
 
 
 if __name__ == "__main__":
@@ -5,3 +5,74 @@ checker = PasswordStrengthChecker()
 result = checker.analyze("Test123!")
 print(f"Test successful! Score: {result['score']}/100, Category: {result['category']}")
 
+
+# Reports handed out from the memo must not share mutable state
+first = checker.analyze("hello")
+first['recommendations'].append("X")
+first['character_analysis']['lowercase_count'] = -1
+second = checker.analyze("hello")
+assert "X" not in second['recommendations']
+assert second['character_analysis']['lowercase_count'] == 5
+print("Cached reports are independent copies")
+
+# Entropy past the float range must not break the cracking time estimate
+long_result = checker.analyze("aB3$" * 40)
+assert long_result['entropy_bits'] > 1024
+assert long_result['cracking_time']['cloud_cracking'] == "Effectively forever"
+print(f"Long password handled: {long_result['entropy_bits']} bits")
+
+# Pasted passwords longer than the 1024-byte tty line limit reach analyze
+pasted_result = checker.analyze("aB3$" * 500)
+assert pasted_result['length'] == 2000
+assert pasted_result['category'] == "Very Strong"
+print(f"Pasted password handled: {pasted_result['length']} characters")
+
+
+def patterns_of(password):
+    """Return the patterns detected in a password."""
+    return checker.analyze(password)['patterns_detected']
+
+
+# Pattern detection on known inputs
+digits = patterns_of("123456789")
+assert digits['sequential_digits'] == ["123456789"]
+assert digits['date_patterns'] == ["1234", "5678"]
+assert digits['common_patterns'] == ["All digits"]
+assert patterns_of("aaaab111")['repetitive_chars'] == ["aaaa", "111"]
+assert patterns_of("aaa\n")['repetitive_chars'] == ["aaa"]
+assert patterns_of("aa\n")['common_patterns'] == []
+# 'İ' lowercases to two characters, 'i' plus a combining dot
+assert patterns_of("İabc")['sequential_letters'] == ["abc"]
+assert patterns_of("ghİ")['sequential_letters'] == ["ghi"]
+assert patterns_of("12/3/2024")['date_patterns'] == ["2024", "12/3/2024"]
+# A run is reported once, as it appears (not repeated run-length times)
+assert checker.analyze("xaaaay")['patterns_detected']['repetitive_chars'] == ["aaaa"]
+print("Pattern detection matches known outputs")
+
+# analyze_batch rows agree with full reports, including the empty password
+batch_passwords = ["", "Test123!", "password", "aaaab111", "Tr0ub4dor&3", "Test123!"]
+for password, row in zip(batch_passwords, checker.analyze_batch(batch_passwords)):
+    full = checker.analyze(password)
+    assert row == (full['length'], full['entropy_bits'], full['score'], full['category'])
+print("analyze_batch matches analyze")
+
+# Batches large enough for the demo's process pool score like in-process runs
+if __name__ == "__main__":
+    import os
+    import tempfile
+    from demo import PARALLEL_THRESHOLD, analyze_passwords
+    
+    with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False) as wordlist:
+        wordlist.write("dragon\nsecure\n")
+    try:
+        dict_checker = PasswordStrengthChecker(wordlist.name)
+        batch = [f"Secure{i}Dragon!" for i in range(PARALLEL_THRESHOLD)]
+        pooled = analyze_passwords(dict_checker, batch)
+        for password, report in zip(batch, pooled):
+            expected = dict_checker.analyze(password)
+            assert report['score'] == expected['score']
+            assert report['dictionary_check'] == expected['dictionary_check']
+        assert pooled[0]['dictionary_check']['contains_dictionary_word']
+    finally:
+        os.remove(wordlist.name)
+    print(f"Process pool matches in-process analysis for {len(batch)} passwords")